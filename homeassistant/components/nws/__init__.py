@@ -11,7 +11,7 @@ from pynws import SimpleNWS
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_API_KEY, CONF_LATITUDE, CONF_LONGITUDE, Platform
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.helpers import debounce
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.device_registry import DeviceEntryType, DeviceInfo
@@ -63,6 +63,7 @@ class NwsDataUpdateCoordinator(TimestampDataUpdateCoordinator[None]):  # pylint:
         request_refresh_debouncer: debounce.Debouncer | None = None,
     ) -> None:
         """Initialize NWS coordinator."""
+        self._unsub_track_refresh: CALLBACK_TYPE | None = None
         super().__init__(
             hass,
             logger,
@@ -73,12 +74,18 @@ class NwsDataUpdateCoordinator(TimestampDataUpdateCoordinator[None]):  # pylint:
         )
         self.failed_update_interval = failed_update_interval
 
+    @callback
+    def _async_unsub_refresh(self) -> None:
+        """Cancel any scheduled call."""
+        super()._async_unsub_refresh()
+        if self._unsub_track_refresh:
+            self._unsub_track_refresh()
+            self._unsub_track_refresh = None
+
     @callback
     def _schedule_refresh(self) -> None:
         """Schedule a refresh."""
-        if self._unsub_refresh:
-            self._unsub_refresh()
-            self._unsub_refresh = None
+        self._async_unsub_refresh()
 
         # We _floor_ utcnow to create a schedule on a rounded second,
         # minimizing the time between the point and the real activation.
@@ -91,7 +98,7 @@ class NwsDataUpdateCoordinator(TimestampDataUpdateCoordinator[None]):  # pylint:
             update_interval = self.update_interval
         else:
             update_interval = self.failed_update_interval
-        self._unsub_refresh = async_track_point_in_utc_time(
+        self._unsub_track_refresh = async_track_point_in_utc_time(
             self.hass,
             self._handle_refresh_interval,
             utcnow().replace(microsecond=0) + update_interval,
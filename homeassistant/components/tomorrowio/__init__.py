@@ -222,7 +222,7 @@ class TomorrowioDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):  #
 
         self.update_interval = async_set_update_interval(self.hass, self._api)
         self._async_unsub_refresh()
-        if self._listeners:
+        if self._has_listeners:
             self._schedule_refresh()
 
     async def async_unload_entry(self, entry: ConfigEntry) -> bool | None:
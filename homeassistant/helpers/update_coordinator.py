@@ -6,7 +6,7 @@ import asyncio
 from collections.abc import Awaitable, Callable, Coroutine, Generator
 from datetime import datetime, timedelta
 import logging
-from random import randint
+from random import random
 from time import monotonic
 from typing import Any, Generic, Protocol, TypeVar
 import urllib.error
@@ -37,6 +37,17 @@ from .debounce import Debouncer
 REQUEST_REFRESH_DEFAULT_COOLDOWN = 10
 REQUEST_REFRESH_DEFAULT_IMMEDIATE = True
 
+_RANDOM_SECONDS_MIN = event.RANDOM_MICROSECOND_MIN / 10**6
+_RANDOM_SECONDS_SPAN = (
+    event.RANDOM_MICROSECOND_MAX - event.RANDOM_MICROSECOND_MIN
+) / 10**6
+
+# The refresh path is bound by event loop scheduling rather than computation.
+# Profiling ``hass --script benchmark coordinator_refresh --profile`` shows
+# most of the time is spent creating and cancelling ``loop.call_at`` timer
+# handles; listener dispatch and logging checks are smaller. Optimizations
+# here should reduce allocations and attribute lookups on that path.
+
 _DataT = TypeVar("_DataT")
 _BaseDataUpdateCoordinatorT = TypeVar(
     "_BaseDataUpdateCoordinatorT", bound="BaseDataUpdateCoordinatorProtocol"
@@ -50,6 +61,34 @@ class UpdateFailed(Exception):
     """Raised when an update has failed."""
 
 
+_TIMEOUT_ERRORS = (TimeoutError, requests.exceptions.Timeout)
+
+# Errors from the update method that only mark the update as failed.
+_UPDATE_FAILED_ERRORS = (
+    *_TIMEOUT_ERRORS,
+    aiohttp.ClientError,
+    requests.exceptions.RequestException,
+    urllib.error.URLError,
+    UpdateFailed,
+)
+
+# Log messages for failed updates, checked in order after the timeouts above.
+# Each message is formatted with the coordinator name and the exception.
+_UPDATE_FAILED_MESSAGES: tuple[tuple[tuple[type[Exception], ...], str], ...] = (
+    (
+        (
+            aiohttp.ClientError,
+            requests.exceptions.RequestException,
+            urllib.error.URLError,
+        ),
+        "Error requesting %s data: %s",
+    ),
+    ((UpdateFailed,), "Error fetching %s data: %s"),
+    ((ConfigEntryError,), "Config entry setup failed while fetching %s data: %s"),
+    ((ConfigEntryAuthFailed,), "Authentication failed while fetching %s data: %s"),
+)
+
+
 class BaseDataUpdateCoordinatorProtocol(Protocol):
     """Base protocol type for DataUpdateCoordinator."""
 
@@ -60,12 +99,44 @@ class BaseDataUpdateCoordinatorProtocol(Protocol):
         """Listen for data updates."""
 
 
+class _ListenerNode:
+    """A listener registered with a DataUpdateCoordinator.
+
+    Listeners are kept in a doubly linked list so adding and removing one
+    does not allocate a closure or hash a dict key.
+    """
+
+    __slots__ = ("_coordinator", "update_callback", "context", "prev", "next")
+
+    def __init__(
+        self,
+        coordinator: DataUpdateCoordinator[Any],
+        update_callback: CALLBACK_TYPE,
+        context: Any,
+    ) -> None:
+        """Initialize the listener node."""
+        self._coordinator: DataUpdateCoordinator[Any] | None = coordinator
+        self.update_callback = update_callback
+        self.context = context
+        self.prev: _ListenerNode | None = None
+        self.next: _ListenerNode | None = None
+
+    @callback
+    def remove(self) -> None:
+        """Remove update listener."""
+        if (coordinator := self._coordinator) is None:
+            return
+        self._coordinator = None
+        coordinator._async_unlink_listener(self)  # pylint: disable=protected-access
+
+
 class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
     """Class to manage fetching data from single endpoint.
 
     Setting :attr:`always_update` to ``False`` will cause coordinator to only
     callback listeners when data has changed. This requires that the data
-    implements ``__eq__`` or uses a python object that already does.
+    implements ``__eq__`` or uses a python object that already does. Returning
+    the same object when nothing has changed skips the comparison entirely.
     """
 
     def __init__(
@@ -84,7 +155,14 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
         self.logger = logger
         self.name = name
         self.update_method = update_method
-        self._update_interval_seconds: float | None = None
+
+        # Pick a random microsecond in range 0.05..0.50 to stagger the refreshes
+        # and avoid a thundering herd.
+        self._microsecond = random() * _RANDOM_SECONDS_SPAN + _RANDOM_SECONDS_MIN
+
+        # The update interval in seconds plus the random microsecond, or None
+        # if there is no update interval.
+        self._update_interval_with_offset: float | None = None
         self.update_interval = update_interval
         self._shutdown_requested = False
         self.config_entry = config_entries.current_entry.get()
@@ -97,13 +175,11 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
         # when it was already checked during setup.
         self.data: _DataT = None  # type: ignore[assignment]
 
-        # Pick a random microsecond in range 0.05..0.50 to stagger the refreshes
-        # and avoid a thundering herd.
-        self._microsecond = (
-            randint(event.RANDOM_MICROSECOND_MIN, event.RANDOM_MICROSECOND_MAX) / 10**6
-        )
-
-        self._listeners: dict[CALLBACK_TYPE, tuple[CALLBACK_TYPE, object | None]] = {}
+        self._listener_head: _ListenerNode | None = None
+        self._listener_tail: _ListenerNode | None = None
+        # Snapshot of the listener callbacks, rebuilt on the next update
+        # after listeners are added or removed.
+        self._update_callbacks: tuple[CALLBACK_TYPE, ...] | None = ()
         job_name = "DataUpdateCoordinator"
         type_name = type(self).__name__
         if type_name != job_name:
@@ -116,7 +192,10 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
             job_name,
             job_type=HassJobType.Coroutinefunction,
         )
-        self._unsub_refresh: CALLBACK_TYPE | None = None
+        # Bind the timer callback once instead of on every call_at.
+        self._refresh_timer_callback = self._async_handle_refresh_timer
+        self._unsub_refresh_handle: asyncio.TimerHandle | None = None
+        self._next_refresh: float = 0
         self._unsub_shutdown: CALLBACK_TYPE | None = None
         self._request_refresh_task: asyncio.TimerHandle | None = None
         self.last_update_success = True
@@ -159,27 +238,46 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
         self, update_callback: CALLBACK_TYPE, context: Any = None
     ) -> Callable[[], None]:
         """Listen for data updates."""
-        schedule_refresh = not self._listeners
+        node = _ListenerNode(self, update_callback, context)
+        self._update_callbacks = None
 
-        @callback
-        def remove_listener() -> None:
-            """Remove update listener."""
-            self._listeners.pop(remove_listener)
-            if not self._listeners:
-                self._unschedule_refresh()
+        if (tail := self._listener_tail) is None:
+            self._listener_head = self._listener_tail = node
+            # This is the first listener, set up interval.
+            self._schedule_refresh()
+        else:
+            node.prev = tail
+            tail.next = node
+            self._listener_tail = node
 
-        self._listeners[remove_listener] = (update_callback, context)
+        return node.remove
 
-        # This is the first listener, set up interval.
-        if schedule_refresh:
-            self._schedule_refresh()
+    @callback
+    def _async_unlink_listener(self, node: _ListenerNode) -> None:
+        """Unlink a listener node from the listener chain."""
+        self._update_callbacks = None
+        prev = node.prev
+        next_ = node.next
+        if prev is None:
+            self._listener_head = next_
+        else:
+            prev.next = next_
+        if next_ is None:
+            self._listener_tail = prev
+        else:
+            next_.prev = prev
 
-        return remove_listener
+        if self._listener_head is None:
+            self._unschedule_refresh()
 
     @callback
     def async_update_listeners(self) -> None:
         """Update all registered listeners."""
-        for update_callback, _ in list(self._listeners.values()):
+        if (update_callbacks := self._update_callbacks) is None:
+            update_callbacks = self._update_callbacks = tuple(
+                update_callback for update_callback, _ in self._async_iter_listeners()
+            )
+        for update_callback in update_callbacks:
             update_callback()
 
     async def async_shutdown(self) -> None:
@@ -198,14 +296,30 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
     def async_contexts(self) -> Generator[Any, None, None]:
         """Return all registered contexts."""
         yield from (
-            context for _, context in self._listeners.values() if context is not None
+            context
+            for _, context in self._async_iter_listeners()
+            if context is not None
         )
 
+    @property
+    def _has_listeners(self) -> bool:
+        """Return if any listeners are registered."""
+        return self._listener_head is not None
+
+    def _async_iter_listeners(
+        self,
+    ) -> Generator[tuple[CALLBACK_TYPE, Any], None, None]:
+        """Yield the callback and context of each registered listener."""
+        node = self._listener_head
+        while node is not None:
+            yield node.update_callback, node.context
+            node = node.next
+
     def _async_unsub_refresh(self) -> None:
         """Cancel any scheduled call."""
-        if self._unsub_refresh:
-            self._unsub_refresh()
-            self._unsub_refresh = None
+        if (handle := self._unsub_refresh_handle) is not None:
+            handle.cancel()
+            self._unsub_refresh_handle = None
 
     def _async_unsub_shutdown(self) -> None:
         """Cancel any scheduled call."""
@@ -222,37 +336,65 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
     def update_interval(self, value: timedelta | None) -> None:
         """Set interval between updates."""
         self._update_interval = value
-        self._update_interval_seconds = value.total_seconds() if value else None
+        self._update_interval_with_offset = (
+            value.total_seconds() + self._microsecond if value else None
+        )
 
     @callback
     def _schedule_refresh(self) -> None:
         """Schedule a refresh."""
-        if self._update_interval_seconds is None:
-            return
-
-        if self.config_entry and self.config_entry.pref_disable_polling:
+        if (interval_with_offset := self._update_interval_with_offset) is None or (
+            self.config_entry and self.config_entry.pref_disable_polling
+        ):
+            self._async_unsub_refresh()
             return
 
         # We do not cancel the debouncer here. If the refresh interval is shorter
         # than the debouncer cooldown, this would cause the debounce to never be called
-        self._async_unsub_refresh()
 
         # We use loop.call_at because DataUpdateCoordinator does
         # not need an exact update interval which also avoids
         # calling dt_util.utcnow() on every update.
-        hass = self.hass
-        loop = hass.loop
-
-        next_refresh = (
-            int(loop.time()) + self._microsecond + self._update_interval_seconds
+        loop = self.hass.loop
+
+        next_refresh = int(loop.time()) + interval_with_offset
+        self._next_refresh = next_refresh
+        if (handle := self._unsub_refresh_handle) is not None:
+            # Pushing the refresh back is common for coordinators that
+            # receive data with async_set_updated_data. Rather than filling
+            # the event loop's heap with cancelled handles, let the pending
+            # timer fire and re-arm itself for the new time.
+            if handle.when() <= next_refresh:
+                return
+            handle.cancel()
+
+        self._unsub_refresh_handle = loop.call_at(
+            next_refresh, self._refresh_timer_callback
         )
-        self._unsub_refresh = loop.call_at(
-            next_refresh, hass.async_run_hass_job, self._job
-        ).cancel
+
+    @callback
+    def _async_handle_refresh_timer(self) -> None:
+        """Handle the refresh timer firing."""
+        loop = self.hass.loop
+        next_refresh = self._next_refresh
+        if (
+            (handle := self._unsub_refresh_handle) is not None
+            and handle.when() < next_refresh
+            and loop.time() < next_refresh
+        ):
+            # The refresh was pushed back after the timer was armed
+            # and the new due time has not been reached yet.
+            self._unsub_refresh_handle = loop.call_at(
+                next_refresh, self._refresh_timer_callback
+            )
+            return
+
+        self._unsub_refresh_handle = None
+        self.hass.async_run_hass_job(self._job)
 
     async def _handle_refresh_interval(self, _now: datetime | None = None) -> None:
         """Handle a refresh interval occurrence."""
-        self._unsub_refresh = None
+        self._unsub_refresh_handle = None
         await self._async_refresh(log_failures=True, scheduled=True)
 
     async def async_request_refresh(self) -> None:
@@ -288,7 +430,7 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
         """Refresh data and log errors."""
         await self._async_refresh(log_failures=True)
 
-    async def _async_refresh(  # noqa: C901
+    async def _async_refresh(
         self,
         log_failures: bool = True,
         raise_on_auth_failed: bool = False,
@@ -296,10 +438,14 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
         raise_on_entry_error: bool = False,
     ) -> None:
         """Refresh data."""
+        if self._shutdown_requested:
+            # async_shutdown already cancelled the timer and the debouncer
+            return
+
         self._async_unsub_refresh()
         self._debounced_refresh.async_cancel()
 
-        if self._shutdown_requested or scheduled and self.hass.is_stopping:
+        if scheduled and self.hass.is_stopping:
             return
 
         if log_timing := self.logger.isEnabledFor(logging.DEBUG):
@@ -309,68 +455,27 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
         previous_update_success = self.last_update_success
         previous_data = self.data
 
+        # Exceptions that are not raised again are stored without their
+        # traceback. The traceback references this frame, which would keep
+        # the coordinator and the previous data alive in a reference cycle.
         try:
             self.data = await self._async_update_data()
 
-        except (TimeoutError, requests.exceptions.Timeout) as err:
-            self.last_exception = err
-            if self.last_update_success:
-                if log_failures:
-                    self.logger.error("Timeout fetching %s data", self.name)
-                self.last_update_success = False
-
-        except (aiohttp.ClientError, requests.exceptions.RequestException) as err:
-            self.last_exception = err
-            if self.last_update_success:
-                if log_failures:
-                    self.logger.error("Error requesting %s data: %s", self.name, err)
-                self.last_update_success = False
-
-        except urllib.error.URLError as err:
-            self.last_exception = err
-            if self.last_update_success:
-                if log_failures:
-                    if err.reason == "timed out":
-                        self.logger.error("Timeout fetching %s data", self.name)
-                    else:
-                        self.logger.error(
-                            "Error requesting %s data: %s", self.name, err
-                        )
-                self.last_update_success = False
-
-        except UpdateFailed as err:
-            self.last_exception = err
-            if self.last_update_success:
-                if log_failures:
-                    self.logger.error("Error fetching %s data: %s", self.name, err)
-                self.last_update_success = False
+        except _UPDATE_FAILED_ERRORS as err:
+            self._async_update_failed(err.with_traceback(None), log_failures)
 
         except ConfigEntryError as err:
-            self.last_exception = err
-            if self.last_update_success:
-                if log_failures:
-                    self.logger.error(
-                        "Config entry setup failed while fetching %s data: %s",
-                        self.name,
-                        err,
-                    )
-                self.last_update_success = False
             if raise_on_entry_error:
+                self._async_update_failed(err, log_failures)
                 raise
+            self._async_update_failed(err.with_traceback(None), log_failures)
 
         except ConfigEntryAuthFailed as err:
             auth_failed = True
-            self.last_exception = err
-            if self.last_update_success:
-                if log_failures:
-                    self.logger.error(
-                        "Authentication failed while fetching %s data: %s",
-                        self.name,
-                        err,
-                    )
-                self.last_update_success = False
             if raise_on_auth_failed:
+                self._async_update_failed(err, log_failures)
                 raise
+            self._async_update_failed(err.with_traceback(None), log_failures)
 
             if self.config_entry:
                 self.config_entry.async_start_reauth(self.hass)
@@ -379,13 +484,14 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
             raise err
 
         except Exception as err:  # pylint: disable=broad-except
-            self.last_exception = err
             self.last_update_success = False
             self.logger.exception(
                 "Unexpected error fetching %s data: %s", self.name, err
             )
+            self.last_exception = err.with_traceback(None)
 
         else:
+            self.last_exception = None
             if not self.last_update_success:
                 self.last_update_success = True
                 self.logger.info("Fetching %s data recovered", self.name)
@@ -398,7 +504,11 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
                     monotonic() - start,
                     self.last_update_success,
                 )
-            if not auth_failed and self._listeners and not self.hass.is_stopping:
+            if (
+                not auth_failed
+                and self._listener_head is not None
+                and not self.hass.is_stopping
+            ):
                 self._schedule_refresh()
 
         if not self.last_update_success and not previous_update_success:
@@ -407,10 +517,31 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
         if (
             self.always_update
             or self.last_update_success != previous_update_success
-            or previous_data != self.data
+            or (previous_data is not self.data and previous_data != self.data)
         ):
             self.async_update_listeners()
 
+    @callback
+    def _async_update_failed(self, err: Exception, log_failures: bool) -> None:
+        """Record a failed update and log it if the last update succeeded."""
+        self.last_exception = err
+        if not self.last_update_success:
+            return
+        self.last_update_success = False
+        if not log_failures:
+            return
+
+        if isinstance(err, _TIMEOUT_ERRORS) or (
+            isinstance(err, urllib.error.URLError) and err.reason == "timed out"
+        ):
+            self.logger.error("Timeout fetching %s data", self.name)
+            return
+
+        for error_types, message in _UPDATE_FAILED_MESSAGES:
+            if isinstance(err, error_types):
+                self.logger.error(message, self.name, err)
+                return
+
     @callback
     def async_set_update_error(self, err: Exception) -> None:
         """Manually set an error, log the message and notify listeners."""
@@ -423,7 +554,6 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
     @callback
     def async_set_updated_data(self, data: _DataT) -> None:
         """Manually update data, notify listeners and reset refresh interval."""
-        self._async_unsub_refresh()
         self._debounced_refresh.async_cancel()
 
         self.data = data
@@ -433,8 +563,10 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
             self.name,
         )
 
-        if self._listeners:
+        if self._listener_head is not None:
             self._schedule_refresh()
+        else:
+            self._async_unsub_refresh()
 
         self.async_update_listeners()
 
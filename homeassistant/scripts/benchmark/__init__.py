@@ -6,8 +6,11 @@ import asyncio
 import collections
 from collections.abc import Callable
 from contextlib import suppress
+import cProfile
+from datetime import timedelta
 import json
 import logging
+import pstats
 from timeit import default_timer as timer
 from typing import TypeVar
 
@@ -19,6 +22,7 @@ from homeassistant.helpers.event import (
     async_track_state_change_event,
 )
 from homeassistant.helpers.json import JSON_DUMP, JSONEncoder
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
 # mypy: allow-untyped-calls, allow-untyped-defs, no-check-untyped-defs
 # mypy: no-warn-return-any
@@ -36,12 +40,23 @@ def run(args):
     parser = argparse.ArgumentParser(description="Run a Home Assistant benchmark.")
     parser.add_argument("name", choices=BENCHMARKS)
     parser.add_argument("--script", choices=["benchmark"])
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Run the benchmark once under cProfile and print the hottest calls",
+    )
 
     args = parser.parse_args()
 
     bench = BENCHMARKS[args.name]
     print("Using event loop:", asyncio.get_event_loop_policy().loop_name)
 
+    if args.profile:
+        profiler = cProfile.Profile()
+        profiler.runcall(asyncio.run, run_benchmark(bench))
+        pstats.Stats(profiler).sort_stats(pstats.SortKey.TIME).print_stats(25)
+        return
+
     with suppress(KeyboardInterrupt):
         while True:
             asyncio.run(run_benchmark(bench))
@@ -301,6 +316,54 @@ async def valid_entity_id(hass):
     return timer() - start
 
 
+@benchmark
+async def coordinator_refresh(hass):
+    """Refresh 1000 coordinators with one listener each a hundred times."""
+    count = 0
+    coordinators_to_create = 1000
+    refreshes = 100
+
+    async def _async_update_data():
+        """Return the same data every time."""
+        return 1
+
+    @core.callback
+    def listener():
+        """Handle update."""
+        nonlocal count
+        count += 1
+
+    coordinators = [
+        DataUpdateCoordinator(
+            hass,
+            logging.getLogger(__name__),
+            name=f"benchmark{idx}",
+            update_interval=timedelta(seconds=30),
+            update_method=_async_update_data,
+        )
+        for idx in range(coordinators_to_create)
+    ]
+    unsubs = [coordinator.async_add_listener(listener) for coordinator in coordinators]
+
+    start = timer()
+
+    for _ in range(refreshes):
+        for coordinator in coordinators:
+            await coordinator.async_refresh()
+            coordinator.async_set_updated_data(2)
+
+    runtime = timer() - start
+
+    for unsub in unsubs:
+        unsub()
+    for coordinator in coordinators:
+        await coordinator.async_shutdown()
+
+    assert count == coordinators_to_create * refreshes * 2
+
+    return runtime
+
+
 @benchmark
 async def json_serialize_states(hass):
     """Serialize million states with websocket default encoder."""
@@ -12,7 +12,11 @@ import requests
 from homeassistant import config_entries
 from homeassistant.const import EVENT_HOMEASSISTANT_STOP
 from homeassistant.core import CoreState, HomeAssistant
-from homeassistant.exceptions import ConfigEntryNotReady
+from homeassistant.exceptions import (
+    ConfigEntryAuthFailed,
+    ConfigEntryError,
+    ConfigEntryNotReady,
+)
 from homeassistant.helpers import update_coordinator
 from homeassistant.util.dt import utcnow
 
@@ -32,6 +36,11 @@ KNOWN_ERRORS: list[tuple[Exception, type[Exception], str]] = [
         urllib.error.URLError,
         "Timeout fetching test data",
     ),
+    (
+        aiohttp.ServerTimeoutError(),
+        aiohttp.ServerTimeoutError,
+        "Timeout fetching test data",
+    ),
     (aiohttp.ClientError(), aiohttp.ClientError, "Error requesting test data"),
     (
         requests.exceptions.RequestException(),
@@ -98,7 +107,7 @@ async def test_async_refresh(
     assert crd.data == 1
     assert crd.last_update_success is True
     # Make sure we didn't schedule a refresh because we have 0 listeners
-    assert crd._unsub_refresh is None
+    assert crd._unsub_refresh_handle is None
 
     updates = []
 
@@ -108,7 +117,7 @@ async def test_async_refresh(
     unsub = crd.async_add_listener(update_callback)
     await crd.async_refresh()
     assert updates == [2]
-    assert crd._unsub_refresh is not None
+    assert crd._unsub_refresh_handle is not None
 
     # Test unsubscribing through function
     unsub()
@@ -126,7 +135,7 @@ async def test_shutdown(
     assert crd.data == 1
     assert crd.last_update_success is True
     # Make sure we didn't schedule a refresh because we have 0 listeners
-    assert crd._unsub_refresh is None
+    assert crd._unsub_refresh_handle is None
 
     updates = []
 
@@ -136,7 +145,7 @@ async def test_shutdown(
     _ = crd.async_add_listener(update_callback)
     await crd.async_refresh()
     assert updates == [2]
-    assert crd._unsub_refresh is not None
+    assert crd._unsub_refresh_handle is not None
 
     # Test shutdown through function
     with patch.object(crd._debounced_refresh, "async_shutdown") as mock_shutdown:
@@ -147,10 +156,12 @@ async def test_shutdown(
 
     # Test we shutdown the debouncer and cleared the subscriptions
     assert len(mock_shutdown.mock_calls) == 1
-    assert crd._unsub_refresh is None
+    assert crd._unsub_refresh_handle is None
 
-    await crd.async_refresh()
+    with patch.object(crd._debounced_refresh, "async_cancel") as mock_cancel:
+        await crd.async_refresh()
     assert updates == [2]
+    mock_cancel.assert_not_called()
 
 
 async def test_shutdown_on_entry_unload(
@@ -177,13 +188,13 @@ async def test_shutdown_on_entry_unload(
     )
 
     crd.async_add_listener(lambda: None)
-    assert crd._unsub_refresh is not None
+    assert crd._unsub_refresh_handle is not None
     assert not crd._shutdown_requested
 
     await entry._async_process_on_unload(hass)
 
     assert crd._shutdown_requested
-    assert crd._unsub_refresh is None
+    assert crd._unsub_refresh_handle is None
 
 
 async def test_shutdown_on_hass_stop(
@@ -208,14 +219,14 @@ async def test_shutdown_on_hass_stop(
     await crd.async_register_shutdown()
 
     crd.async_add_listener(lambda: None)
-    assert crd._unsub_refresh is not None
+    assert crd._unsub_refresh_handle is not None
     assert not crd._shutdown_requested
 
     hass.bus.async_fire(EVENT_HOMEASSISTANT_STOP)
     await hass.async_block_till_done()
 
     assert crd._shutdown_requested
-    assert crd._unsub_refresh is None
+    assert crd._unsub_refresh_handle is None
 
 
 async def test_update_context(
@@ -244,6 +255,113 @@ async def test_update_context(
     assert not set(crd.async_contexts())
 
 
+async def test_remove_listener_during_update(
+    crd: update_coordinator.DataUpdateCoordinator[int],
+) -> None:
+    """Test listeners can be removed while listeners are being updated."""
+    calls = []
+
+    def update_callback1():
+        calls.append(1)
+        unsub1()
+
+    def update_callback2():
+        calls.append(2)
+
+    def update_callback3():
+        calls.append(3)
+
+    unsub1 = crd.async_add_listener(update_callback1)
+    unsub2 = crd.async_add_listener(update_callback2)
+    unsub3 = crd.async_add_listener(update_callback3)
+
+    crd.async_update_listeners()
+    assert calls == [1, 2, 3]
+
+    crd.async_update_listeners()
+    assert calls == [1, 2, 3, 2, 3]
+
+    # Removing twice is a no-op
+    unsub1()
+    unsub3()
+    unsub3()
+    crd.async_update_listeners()
+    assert calls == [1, 2, 3, 2, 3, 2]
+    assert crd._unsub_refresh_handle is not None
+
+    unsub2()
+    assert crd._listener_head is None
+    assert crd._listener_tail is None
+    assert crd._unsub_refresh_handle is None
+
+
+async def test_listener_changes_during_update(
+    crd: update_coordinator.DataUpdateCoordinator[int],
+) -> None:
+    """Test listener changes during an update apply from the next update."""
+    calls = []
+
+    def update_callback1():
+        calls.append(1)
+        unsub1()
+        unsub2()
+        unsubs.append(crd.async_add_listener(update_callback4))
+
+    def update_callback2():
+        calls.append(2)
+
+    def update_callback3():
+        calls.append(3)
+
+    def update_callback4():
+        calls.append(4)
+
+    unsubs = []
+    unsub1 = crd.async_add_listener(update_callback1)
+    unsub2 = crd.async_add_listener(update_callback2)
+    unsub3 = crd.async_add_listener(update_callback3)
+
+    # The removed listener is still called and the added one is not
+    crd.async_update_listeners()
+    assert calls == [1, 2, 3]
+
+    crd.async_update_listeners()
+    assert calls == [1, 2, 3, 3, 4]
+
+    unsub3()
+    for unsub in unsubs:
+        unsub()
+    assert crd._unsub_refresh_handle is None
+
+
+async def test_update_callbacks_cached(
+    crd: update_coordinator.DataUpdateCoordinator[int],
+) -> None:
+    """Test the listener callbacks are only collected after listeners change."""
+    update_callback1 = Mock()
+    update_callback2 = Mock()
+
+    unsub1 = crd.async_add_listener(update_callback1)
+    crd.async_update_listeners()
+    update_callbacks = crd._update_callbacks
+    assert update_callbacks == (update_callback1,)
+
+    crd.async_update_listeners()
+    assert crd._update_callbacks is update_callbacks
+
+    unsub2 = crd.async_add_listener(update_callback2)
+    crd.async_update_listeners()
+    assert crd._update_callbacks == (update_callback1, update_callback2)
+
+    unsub1()
+    crd.async_update_listeners()
+    assert crd._update_callbacks == (update_callback2,)
+    assert update_callback1.call_count == 3
+    assert update_callback2.call_count == 2
+
+    unsub2()
+
+
 async def test_request_refresh(
     crd: update_coordinator.DataUpdateCoordinator[int],
 ) -> None:
@@ -298,9 +416,42 @@ async def test_refresh_known_errors(
     assert crd.data is None
     assert crd.last_update_success is False
     assert isinstance(crd.last_exception, err_msg[1])
+    assert crd.last_exception.__traceback__ is None
     assert err_msg[2] in caplog.text
 
 
+@pytest.mark.parametrize(
+    ("err", "message"),
+    [
+        (
+            ConfigEntryError("boom"),
+            "Config entry setup failed while fetching test data",
+        ),
+        (
+            ConfigEntryAuthFailed("boom"),
+            "Authentication failed while fetching test data",
+        ),
+    ],
+)
+async def test_refresh_config_entry_errors(
+    err: Exception,
+    message: str,
+    crd: update_coordinator.DataUpdateCoordinator[int],
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test config entry errors are logged once."""
+    crd.update_method = AsyncMock(side_effect=err)
+
+    await crd.async_refresh()
+
+    assert crd.last_update_success is False
+    assert crd.last_exception is err
+    assert caplog.text.count(message) == 1
+
+    await crd.async_refresh()
+    assert caplog.text.count(message) == 1
+
+
 async def test_refresh_fail_unknown(
     crd: update_coordinator.DataUpdateCoordinator[int], caplog: pytest.LogCaptureFixture
 ) -> None:
@@ -313,7 +464,10 @@ async def test_refresh_fail_unknown(
 
     assert crd.data == 1  # value from previous fetch
     assert crd.last_update_success is False
+    assert isinstance(crd.last_exception, ValueError)
+    assert crd.last_exception.__traceback__ is None
     assert "Unexpected error fetching test data" in caplog.text
+    assert "Traceback" in caplog.text
 
 
 async def test_refresh_no_update_method(
@@ -405,10 +559,12 @@ async def test_refresh_recover(
 ) -> None:
     """Test recovery of freshing data."""
     crd.last_update_success = False
+    crd.last_exception = update_coordinator.UpdateFailed()
 
     await crd.async_refresh()
 
     assert crd.last_update_success is True
+    assert crd.last_exception is None
     assert "Fetching test data recovered" in caplog.text
 
 
@@ -444,9 +600,9 @@ async def test_coordinator_entity(
     assert list(crd.async_contexts()) == [context]
 
     # Call remove callback to cleanup debouncer and avoid lingering timer
-    assert len(crd._listeners) == 1
+    assert crd._listener_head is not None
     _on_remove_callback()
-    assert len(crd._listeners) == 0
+    assert crd._listener_head is None
 
 
 async def test_async_set_updated_data(
@@ -466,7 +622,7 @@ async def test_async_set_updated_data(
     assert crd.last_update_success is True
 
     # Make sure we didn't schedule a refresh because we have 0 listeners
-    assert crd._unsub_refresh is None
+    assert crd._unsub_refresh_handle is None
 
     updates = []
 
@@ -476,18 +632,66 @@ async def test_async_set_updated_data(
     remove_callbacks = crd.async_add_listener(update_callback)
     crd.async_set_updated_data(200)
     assert updates == [200]
-    assert crd._unsub_refresh is not None
+    assert crd._unsub_refresh_handle is not None
 
-    old_refresh = crd._unsub_refresh
+    old_refresh = crd._unsub_refresh_handle
 
     crd.async_set_updated_data(300)
-    # We have created a new refresh listener
-    assert crd._unsub_refresh is not old_refresh
+    # We keep the pending refresh timer instead of creating a new one
+    assert crd._unsub_refresh_handle is old_refresh
+    assert not old_refresh.cancelled()
 
     # Remove callbacks to avoid lingering timers
     remove_callbacks()
 
 
+async def test_pushed_back_refresh(
+    hass: HomeAssistant,
+    freezer: FrozenDateTimeFactory,
+    crd: update_coordinator.DataUpdateCoordinator[int],
+) -> None:
+    """Test pushing data delays the refresh without replacing the timer."""
+    remove_callbacks = crd.async_add_listener(lambda: None)
+    handle = crd._unsub_refresh_handle
+
+    freezer.tick(timedelta(seconds=10))
+    crd.async_set_updated_data(5)
+    assert crd._unsub_refresh_handle is handle
+
+    # The original timer fires before the new due time and re-arms itself
+    freezer.tick(timedelta(seconds=5))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert crd.data == 5
+    assert crd._unsub_refresh_handle is not handle
+
+    freezer.tick(timedelta(seconds=6))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert crd.data == 1
+
+    remove_callbacks()
+
+
+async def test_refresh_after_pushed_back_due_time(
+    hass: HomeAssistant,
+    freezer: FrozenDateTimeFactory,
+    crd: update_coordinator.DataUpdateCoordinator[int],
+) -> None:
+    """Test a timer firing after the pushed back due time refreshes right away."""
+    remove_callbacks = crd.async_add_listener(lambda: None)
+
+    freezer.tick(timedelta(seconds=10))
+    crd.async_set_updated_data(5)
+
+    freezer.tick(timedelta(seconds=31))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert crd.data == 1
+
+    remove_callbacks()
+
+
 async def test_stop_refresh_on_ha_stop(
     hass: HomeAssistant, crd: update_coordinator.DataUpdateCoordinator[int]
 ) -> None:
@@ -565,7 +769,7 @@ async def test_not_schedule_refresh_if_system_option_disable_polling(
     config_entries.current_entry.set(entry)
     crd = get_crd(hass, DEFAULT_UPDATE_INTERVAL)
     crd.async_add_listener(lambda: None)
-    assert crd._unsub_refresh is None
+    assert crd._unsub_refresh_handle is None
 
 
 async def test_async_set_update_error(
@@ -672,6 +876,36 @@ async def test_only_callback_on_change_when_always_update_is_false(
     remove_callbacks()
 
 
+async def test_same_data_object_is_not_compared(
+    crd: update_coordinator.DataUpdateCoordinator[int],
+) -> None:
+    """Test returning the same data object skips the equality check."""
+    comparisons = 0
+
+    class Data:
+        def __eq__(self, other: object) -> bool:
+            nonlocal comparisons
+            comparisons += 1
+            return other is self
+
+    data = Data()
+    crd.always_update = False
+    crd.update_method = AsyncMock(return_value=data)
+    update_callback = Mock()
+    remove_callbacks = crd.async_add_listener(update_callback)
+
+    await crd.async_refresh()
+    update_callback.assert_called_once()
+    update_callback.reset_mock()
+    comparisons = 0
+
+    await crd.async_refresh()
+    update_callback.assert_not_called()
+    assert comparisons == 0
+
+    remove_callbacks()
+
+
 async def test_always_callback_when_always_update_is_true(
     crd: update_coordinator.DataUpdateCoordinator[int], caplog: pytest.LogCaptureFixture
 ) -> None: